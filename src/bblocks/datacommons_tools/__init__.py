@@ -1,8 +1,15 @@
 from importlib.metadata import version
+from typing import TYPE_CHECKING
 
-from .custom_data.config_utils import merge_configs_from_directory
-from .custom_data.data_management import CustomDataManager
-from .custom_data.schema_tools import csv_metadata_to_nodes, csv_metadata_to_mfc_file
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .custom_data.config_utils import merge_configs_from_directory
+    from .custom_data.data_management import CustomDataManager
+    from .custom_data.schema_tools import (
+        csv_metadata_to_nodes,
+        csv_metadata_to_mfc_file,
+    )
 
 
 __version__ = version("bblocks-datacommons-tools")
@@ -14,3 +21,15 @@ __all__ = [
     "csv_metadata_to_mfc_file",
     "merge_configs_from_directory",
 ]
+
+# Public names are imported on first access so that importing a subpackage
+# (for example the CLI) does not pull in pandas.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CustomDataManager": ".custom_data.data_management",
+        "csv_metadata_to_nodes": ".custom_data.schema_tools",
+        "csv_metadata_to_mfc_file": ".custom_data.schema_tools",
+        "merge_configs_from_directory": ".custom_data.config_utils",
+    },
+)
@@ -0,0 +1,37 @@
+"""
+Lazy (PEP 562) exports for package ``__init__`` modules.
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Each exported name is imported from its module on first access and then
+    cached on the package.
+
+    Args:
+        package: The ``__name__`` of the package exposing the names.
+        exports: Map from exported name to the module (relative to ``package``)
+            that defines it.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions to assign in the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -3,22 +3,128 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
+from typing import Sequence
 
-from bblocks.datacommons_tools.custom_data.schema_tools import (
-    csv_metadata_to_mfc_file,
-    NodeTypes,
+from bblocks.datacommons_tools.custom_data.models.data_files import (
+    validate_mcf_file_name,
 )
 
-__all__ = ["add_parser", "run"]
+__all__ = ["add_parser", "fast_parse", "run"]
+
+
+class _Choices(tuple):
+    """Ordered choices (for help and error messages) with hashed membership."""
+
+    def __new__(cls, values: tuple[str, ...]) -> _Choices:
+        choices = super().__new__(cls, values)
+        choices._members = frozenset(values)
+        return choices
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._members
+
+
+# Mirrors ``schema_tools.NodeTypes`` without importing it (and pandas) at startup
+_NODE_TYPE_CHOICES = _Choices(
+    ("Node", "StatVar", "StatVarGroup", "Topic", "StatVarPeerGroup")
+)
 
 
 def _kv_pair(value: str) -> tuple[str, str]:
-    """Parse a KEY=VALUE string into a tuple."""
-    if "=" not in value:
+    """Parse a KEY=VALUE string into a tuple.
+
+    Keys come from a small vocabulary (column names, ``read_csv`` options) and
+    end up as dictionary keys, so they are interned. Values are left as-is.
+    """
+    key, sep, val = value.partition("=")
+    if not sep:
         raise ValueError(f"Invalid key-value pair: {value}")
-    key, val = value.split("=", 1)
-    return key.strip(), val.strip()
+    return sys.intern(key.strip()), val.strip()
+
+
+class _KVDictAction(argparse.Action):
+    """Collect repeated KEY=VALUE options straight into a dictionary."""
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        items = getattr(namespace, self.dest) or {}
+        key, val = values
+        items[key] = val
+        setattr(namespace, self.dest, items)
+
+
+def fast_parse(argv: Sequence[str]) -> argparse.Namespace | None:
+    """Parse a plain ``csv2mcf`` invocation without building the argparse tree.
+
+    Only exact long options followed by a separate value are understood. Anything
+    else (help flags, abbreviations, ``--opt=value``, invalid values...) returns
+    ``None`` so the caller can fall back to the full argparse parser, which also
+    takes care of reporting errors.
+    """
+    if not argv or argv[0] != "csv2mcf":
+        return None
+
+    positionals: list[str] = []
+    collected: dict[str, dict[str, str] | list[str]] = {}
+    node_type = "Node"
+    chunksize = None
+    jobs = 1
+    override = False
+
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token == "--override":
+            override = True
+            continue
+        if not token.startswith("-"):
+            positionals.append(token)
+            continue
+
+        value = next(tokens, None)
+        if value is None or value.startswith("-"):
+            return None
+
+        if token == "--node-type":
+            if value not in _NODE_TYPE_CHOICES:
+                return None
+            node_type = value
+        elif token in ("--column-mapping", "--csv-option"):
+            try:
+                key, val = _kv_pair(value)
+            except ValueError:
+                return None
+            collected.setdefault(token, {})[key] = val
+        elif token == "--ignore-column":
+            collected.setdefault(token, []).append(value)
+        elif token in ("--chunksize", "--jobs"):
+            try:
+                number = int(value)
+            except ValueError:
+                return None
+            if token == "--chunksize":
+                chunksize = number
+            else:
+                jobs = number
+        else:
+            return None
+
+    if len(positionals) != 2:
+        return None
+
+    return argparse.Namespace(
+        command="csv2mcf",
+        csv=Path(positionals[0]),
+        mcf=Path(positionals[1]),
+        node_type=node_type,
+        column_mapping=collected.get("--column-mapping"),
+        csv_option=collected.get("--csv-option"),
+        ignore_column=collected.get("--ignore-column"),
+        chunksize=chunksize,
+        jobs=jobs,
+        override=override,
+        func=run,
+    )
 
 
 def add_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -32,7 +138,7 @@ def add_parser(subparsers: argparse._SubParsersAction) -> None:
 
     parser.add_argument(
         "--node-type",
-        choices=[node_type.value for node_type in NodeTypes],
+        choices=_NODE_TYPE_CHOICES,
         default="Node",
         help="Type of node to create (default: %(default)s)",
     )
@@ -41,7 +147,7 @@ def add_parser(subparsers: argparse._SubParsersAction) -> None:
         "--column-mapping",
         metavar="CSV_COL=MCF_PROP",
         type=_kv_pair,
-        action="append",
+        action=_KVDictAction,
         help=(
             "Map CSV column names to MCF properties. "
             "May be used multiple times, eg: "
@@ -53,7 +159,7 @@ def add_parser(subparsers: argparse._SubParsersAction) -> None:
         "--csv-option",
         metavar="KEY=VALUE",
         type=_kv_pair,
-        action="append",
+        action=_KVDictAction,
         help=(
             "Extra keyword arguments forwarded to pandas.read_csv, "
             'e.g. --csv-option delimiter=";" --csv-option encoding=UTF-8'
@@ -67,6 +173,23 @@ def add_parser(subparsers: argparse._SubParsersAction) -> None:
         help="Name of a CSV column to ignore. May be specified multiple times.",
     )
 
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help=(
+            "Read the CSV in chunks of this many rows and write the MCF file "
+            "as each chunk is converted"
+        ),
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes used to convert the CSV (default: %(default)s)",
+    )
+
     parser.add_argument(
         "--override",
         action="store_true",
@@ -78,16 +201,37 @@ def add_parser(subparsers: argparse._SubParsersAction) -> None:
 
 def run(args: argparse.Namespace) -> int:
     """Execute the ``csv2mcf`` command."""
-    column_mapping = dict(args.column_mapping) if args.column_mapping else None
-    csv_options = dict(args.csv_option) if args.csv_option else None
+    # Only expand ``~``: resolving would turn /dev/fd/N into an unusable pipe:[...]
+    csv_path = args.csv.expanduser()
+    mcf_path = args.mcf.expanduser()
+
+    # Fail on inputs that are already known to be wrong before importing pandas.
+    # An existing output is fine: without --override the nodes are appended.
+    # ``exists`` rather than ``is_file`` so pipes and /dev/stdin are accepted.
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {args.csv}")
+    validate_mcf_file_name(mcf_path.name)
+
+    # Imported here so that ``--help`` and argument errors don't pay for pandas
+    from bblocks.datacommons_tools.custom_data.schema_tools import (
+        csv_metadata_to_mfc_file,
+    )
+
+    # Parse the file in one pass with the C engine unless told otherwise
+    csv_options = dict(args.csv_option or {})
+    if csv_options.get("engine", "c") == "c":
+        csv_options.setdefault("low_memory", False)
+    if args.chunksize:
+        csv_options["chunksize"] = args.chunksize
 
     csv_metadata_to_mfc_file(
-        csv_path=args.csv,
-        mcf_path=args.mcf,
+        csv_path=csv_path,
+        mcf_path=mcf_path,
         node_type=args.node_type,
-        column_to_property_mapping=column_mapping,
+        column_to_property_mapping=args.column_mapping,
         csv_options=csv_options,
-        ignore_columns=args.ignore_column,
+        ignore_columns=frozenset(args.ignore_column) if args.ignore_column else None,
         override=args.override,
+        max_workers=args.jobs,
     )
     return 0
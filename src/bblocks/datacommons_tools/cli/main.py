@@ -1,6 +1,8 @@
 """Entry point for the ``bblocks.datacommons_tools`` command line interface."""
 
 import argparse
+import sys
+from functools import cache
 from typing import Iterable
 
 from bblocks.datacommons_tools.cli import (
@@ -14,8 +16,13 @@ from bblocks.datacommons_tools.cli import (
 __all__ = ["main"]
 
 
+@cache
 def _build_parser() -> argparse.ArgumentParser:
-    """Create the CLI argument parser and register commands."""
+    """Create the CLI argument parser and register commands.
+
+    The parser holds no per-call state, so it is built once and reused by
+    every ``main()`` call in the process.
+    """
     parser = argparse.ArgumentParser(
         description="Utilities for working with Data Commons files"
     )
@@ -30,8 +37,18 @@ def _build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Iterable[str] | None = None) -> int:
     """Parse ``argv`` and execute the selected command."""
+    if argv is None:
+        argv = sys.argv[1:]
+    elif not isinstance(argv, (list, tuple)):
+        argv = list(argv)
+
+    # Common csv2mcf invocations skip building the full parser
+    args = csv2mcf.fast_parse(argv)
+    if args is not None:
+        return args.func(args)
+
     parser = _build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
+    args = parser.parse_args(argv)
 
     if hasattr(args, "func"):
         return args.func(args)
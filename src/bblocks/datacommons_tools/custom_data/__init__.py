@@ -1,5 +1,16 @@
-from bblocks.datacommons_tools.custom_data.data_management import CustomDataManager
+from typing import TYPE_CHECKING
+
+from bblocks.datacommons_tools._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from bblocks.datacommons_tools.custom_data.data_management import (
+        CustomDataManager,
+    )
 
 __all__ = [
     "CustomDataManager",
 ]
+
+# Imported on first access: data_management depends on pandas, which the
+# models (and the code importing them) don't need.
+__getattr__, __dir__ = lazy_exports(__name__, {"CustomDataManager": ".data_management"})
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from os import PathLike
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    List,
+    Any,
+    Callable,
+    Iterable,
+    ParamSpec,
+    TypeVar,
+)
 
-import pandas as pd
 from pydantic import HttpUrl
 
 from bblocks.datacommons_tools.custom_data.config_utils import (
@@ -21,6 +33,7 @@ from bblocks.datacommons_tools.custom_data.models.data_files import (
     ColumnMappings,
     ExplicitSchemaFile,
     MCFFileName,
+    validate_mcf_file_name,
 )
 from bblocks.datacommons_tools.custom_data.models.mcf import MCFNodes
 from bblocks.datacommons_tools.custom_data.models.sources import Source
@@ -30,36 +43,46 @@ from bblocks.datacommons_tools.custom_data.models.stat_vars import (
     StatVarMCFNode,
     StatVarGroupMCFNode,
 )
-from bblocks.datacommons_tools.custom_data.schema_tools import (
-    csv_metadata_to_nodes,
-    build_stat_var_groups_from_strings,
-    validate_mcf_file_name,
-)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 DC_DOCS_URL = "https://docs.datacommons.org/custom_dc/custom_data.html"
 DEFAULT_STATVAR_MCF_NAME: str = "custom_nodes.mcf"
 DEFAULT_GROUP_NAME: str = "custom_groups.mcf"
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
 
-def _parse_kwargs_into_properties(locals_dict: Dict[str, str | dict]) -> Dict[str, str]:
-    """Parse a dictionary of keyword arguments into a dictionary of properties"""
 
-    props = {
-        k: v
-        for k, v in locals_dict.items()
-        if k not in {"self", "additional_properties", "override", "mcf_file_name"}
-        and v is not None
-    }
+def _parse_kwargs_into_properties(
+    additional_properties: Optional[Dict[str, str]] = None, **properties: Any
+) -> Dict[str, str]:
+    """Parse keyword arguments into a dictionary of properties
 
-    if "additional_properties" in locals_dict:
-        # add the additional properties to the props dictionary
-        additional = locals_dict.get("additional_properties", {})
-        if additional:
-            props.update(additional)
+    Properties set to None are dropped and ``additional_properties`` (if any) are
+    merged on top.
+    """
+
+    props = {k: v for k, v in properties.items() if v is not None}
+
+    if additional_properties:
+        props.update(additional_properties)
 
     return props
 
 
+def _modifies_config(method: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Mark the manager's config as needing validation when ``method`` is called"""
+
+    @wraps(method)
+    def wrapper(self: CustomDataManager, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        self._config_validated = False
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class CustomDataManager:
     """Class to handle the config json, data, and MCF files for Custom Data Commons
 
@@ -201,23 +224,25 @@ class CustomDataManager:
             }
 
         self._data = {}
+        self._config_validated = False
 
     def __repr__(self) -> str:
-        input_files_count = len(self._config.inputFiles)
-        sources_count = len(self._config.sources)
-        nodes_count = sum(
-            [len(var) for var in [n.nodes for n in self._mcf_nodes.values()] if var]
-        )
-
-        variables_count = len(self._config.variables or {}) + nodes_count
+        config = self._config
+        input_files_count = len(config.inputFiles)
+        sources_count = len(config.sources)
+        nodes_count = sum(len(n.nodes) for n in self._mcf_nodes.values())
+
+        variables_count = (
+            len(config.variables) if config.variables else 0
+        ) + nodes_count
         dataframes_count = len(self._data)
 
-        include_input_subdirs = self._config.includeInputSubdirs
-        group_statvars = self._config.groupStatVarsByProperty
-        root_group_name = self._config.defaultCustomRootStatVarGroupName
-        namespace = self._config.customIdNamespace
-        svg_prefix = self._config.customSvgPrefix
-        blocklist = self._config.svHierarchyPropsBlocklist
+        include_input_subdirs = config.includeInputSubdirs
+        group_statvars = config.groupStatVarsByProperty
+        root_group_name = config.defaultCustomRootStatVarGroupName
+        namespace = config.customIdNamespace
+        svg_prefix = config.customSvgPrefix
+        blocklist = config.svHierarchyPropsBlocklist
 
         return (
             f"<CustomDataManager config: "
@@ -231,16 +256,19 @@ class CustomDataManager:
             f"svHierarchyPropsBlocklist={blocklist}>"
         )
 
+    @_modifies_config
     def set_includeInputSubdirs(self, set_value: bool) -> CustomDataManager:
         """Set the includeInputSubdirs attribute of the config"""
         self._config.includeInputSubdirs = set_value
         return self
 
+    @_modifies_config
     def set_groupStatVarsByProperty(self, set_value: bool) -> CustomDataManager:
         """Set the groupStatVarsByProperty attribute of the config"""
         self._config.groupStatVarsByProperty = set_value
         return self
 
+    @_modifies_config
     def set_defaultCustomRootStatVarGroupName(
         self, name: Optional[str]
     ) -> CustomDataManager:
@@ -249,6 +277,7 @@ class CustomDataManager:
         self._config.defaultCustomRootStatVarGroupName = name
         return self
 
+    @_modifies_config
     def set_customIdNamespace(
         self, namespace: Optional[str], *, update_svg_prefix: bool = True
     ) -> CustomDataManager:
@@ -268,12 +297,14 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def set_customSvgPrefix(self, prefix: Optional[str]) -> CustomDataManager:
         """Set the prefix used for generated custom StatVarGroup IDs."""
 
         self._config.customSvgPrefix = prefix
         return self
 
+    @_modifies_config
     def set_svHierarchyPropsBlocklist(
         self, blocklist: Optional[List[str]]
     ) -> CustomDataManager:
@@ -295,6 +326,7 @@ class CustomDataManager:
             self._config.svHierarchyPropsBlocklist = deduped
         return self
 
+    @_modifies_config
     def add_provenance(
         self,
         provenance_name: str,
@@ -322,31 +354,128 @@ class CustomDataManager:
                 or if the provenance already exists and override is not set to True.
         """
 
+        sources = self._config.sources
+
         # if the source does not exist, add it
-        if source_name not in self._config.sources:
+        if source_name not in sources:
             # if the source URL is not provided, raise an error
             if source_url is None:
                 raise ValueError(
                     f"Source '{source_name}' not found. "
                     "Please provide a source URL so the source can be added."
                 )
-            self._config.sources[source_name] = Source(
+            sources[source_name] = Source(
                 url=source_url, provenances={provenance_name: provenance_url}
             )
 
         # if the source exists, add the provenance
         else:
+            provenances = sources[source_name].provenances
             # check if the provenance already exists
-            if provenance_name in self._config.sources[source_name].provenances:
-                if not override:
+            if not override and provenance_name in provenances:
+                raise ValueError(
+                    f"Provenance '{provenance_name}' already exists for source '{source_name}'. "
+                    "Use override=True to overwrite it."
+                )
+            # only parse the URL if it isn't already a validated HttpUrl
+            provenances[provenance_name] = (
+                provenance_url
+                if isinstance(provenance_url, HttpUrl)
+                else HttpUrl(provenance_url)
+            )
+
+        return self
+
+    @_modifies_config
+    def add_provenances(
+        self,
+        provenances: Iterable[
+            tuple[str, HttpUrl | str, str]
+            | tuple[str, HttpUrl | str, str, Optional[HttpUrl | str]]
+        ],
+        override: bool = False,
+    ) -> CustomDataManager:
+        """Add several provenances to the config at once
+
+        Works like calling ``add_provenance`` for each item, but the provenances are
+        grouped by source and added with a single update per source. Every item is
+        checked before the config is changed, so nothing is added if one of them fails.
+
+        Args:
+            provenances: Tuples of ``(provenance_name, provenance_url, source_name)``
+                or ``(provenance_name, provenance_url, source_name, source_url)``.
+                A source URL is only needed the first time a new source appears.
+            override: If True, overwrite existing provenances. Defaults to False.
+
+        Raises:
+            ValueError: If an item does not have 3 or 4 elements, if a new source has
+                no source URL or is given different source URLs, or if a provenance
+                already exists (in the config or earlier in ``provenances``) and
+                override is not set to True.
+        """
+
+        sources = self._config.sources
+        new_source_urls: Dict[str, HttpUrl] = {}
+        grouped: Dict[str, Dict[str, HttpUrl]] = {}
+
+        for item in provenances:
+            if len(item) == 3:
+                provenance_name, provenance_url, source_name = item
+                source_url = None
+            elif len(item) == 4:
+                provenance_name, provenance_url, source_name, source_url = item
+            else:
+                raise ValueError(
+                    "Expected (provenance_name, provenance_url, source_name) or "
+                    "(provenance_name, provenance_url, source_name, source_url), "
+                    f"got {item!r}"
+                )
+
+            if source_name not in sources:
+                if source_url is not None:
+                    if not isinstance(source_url, HttpUrl):
+                        source_url = HttpUrl(source_url)
+                    known_url = new_source_urls.setdefault(source_name, source_url)
+                    if known_url != source_url:
+                        raise ValueError(
+                            f"Source '{source_name}' is given conflicting URLs: "
+                            f"'{known_url}' and '{source_url}'."
+                        )
+                elif source_name not in new_source_urls:
                     raise ValueError(
-                        f"Provenance '{provenance_name}' already exists for source '{source_name}'. "
-                        "Use override=True to overwrite it."
+                        f"Source '{source_name}' not found. "
+                        "Please provide a source URL so the source can be added."
                     )
-            self._config.sources[source_name].provenances[provenance_name] = HttpUrl(
+
+            source_provenances = grouped.setdefault(source_name, {})
+            if not override and (
+                provenance_name in source_provenances
+                or (
+                    source_name in sources
+                    and provenance_name in sources[source_name].provenances
+                )
+            ):
+                raise ValueError(
+                    f"Provenance '{provenance_name}' already exists for source '{source_name}'. "
+                    "Use override=True to overwrite it."
+                )
+            source_provenances[provenance_name] = (
                 provenance_url
+                if isinstance(provenance_url, HttpUrl)
+                else HttpUrl(provenance_url)
             )
 
+        # build the new sources before touching the config, so an invalid source URL
+        # leaves it unchanged
+        new_sources = {
+            name: Source(url=url, provenances=grouped[name])
+            for name, url in new_source_urls.items()
+        }
+        for source_name, source_provenances in grouped.items():
+            if source_name not in new_sources:
+                sources[source_name].provenances.update(source_provenances)
+        sources.update(new_sources)
+
         return self
 
     def add_variable_to_mcf(
@@ -393,7 +522,21 @@ class CustomDataManager:
         """
 
         # Transform the passed arguments into a properties dictionary
-        props = _parse_kwargs_into_properties(locals())
+        props = _parse_kwargs_into_properties(
+            additional_properties,
+            Node=Node,
+            name=name,
+            memberOf=memberOf,
+            statType=statType,
+            shortDisplayName=shortDisplayName,
+            description=description,
+            searchDescription=searchDescription,
+            provenance=provenance,
+            populationType=populationType,
+            measuredProperty=measuredProperty,
+            measurementQualifier=measurementQualifier,
+            measurementDenominator=measurementDenominator,
+        )
         # add a new node to the MCF file
         node = StatVarMCFNode(**props)
 
@@ -438,7 +581,15 @@ class CustomDataManager:
             CustomDataManager object
         """
         # Transform the passed arguments into a properties dictionary
-        props = _parse_kwargs_into_properties(locals())
+        props = _parse_kwargs_into_properties(
+            additional_properties,
+            Node=Node,
+            name=name,
+            specializationOf=specializationOf,
+            description=description,
+            provenance=provenance,
+            shortDisplayName=shortDisplayName,
+        )
 
         # add a new node to the MCF file
         node = StatVarGroupMCFNode(**props)
@@ -482,6 +633,12 @@ class CustomDataManager:
             ignore_columns: List of columns to ignore in the CSV file.
             override: If True, overwrite the existing nodes if they exist. Defaults to False.
         """
+        # Imported here so that managers which never read a CSV don't load pandas
+        from bblocks.datacommons_tools.custom_data.schema_tools import (
+            build_stat_var_groups_from_strings,
+            csv_metadata_to_nodes,
+        )
+
         stat_vars = csv_metadata_to_nodes(
             file_path=csv_file_path,
             column_to_property_mapping=column_to_property_mapping,
@@ -504,11 +661,13 @@ class CustomDataManager:
         # validate the file name
         name = validate_mcf_file_name(mcf_file_name)
         # add the nodes
-        for node in stat_vars.nodes:
-            self._mcf_nodes.setdefault(name, MCFNodes()).add(node, override=override)
+        self._mcf_nodes.setdefault(name, MCFNodes()).add_many(
+            stat_vars.nodes, override=override
+        )
 
         return self
 
+    @_modifies_config
     def add_variable_to_config(
         self,
         statVar: str,
@@ -538,15 +697,16 @@ class CustomDataManager:
         # check if the config has a variables section
         if self._config.variables is None:
             self._config.variables = {}
+        # read back after assigning: validate_assignment may store a copy
+        variables = self._config.variables
 
         # check if the variable already exists
-        if statVar in self._config.variables:
-            if not override:
-                raise ValueError(
-                    f"Variable '{statVar}' already exists. Use override=True to overwrite it."
-                )
+        if not override and statVar in variables:
+            raise ValueError(
+                f"Variable '{statVar}' already exists. Use override=True to overwrite it."
+            )
 
-        self._config.variables[statVar] = Variable(
+        variables[statVar] = Variable(
             name=name,
             description=description,
             searchDescriptions=searchDescriptions,
@@ -555,22 +715,68 @@ class CustomDataManager:
         )
         return self
 
+    @_modifies_config
+    def add_variables_to_config(
+        self, variables: Dict[str, Variable | Dict[str, Any]], override: bool = False
+    ) -> CustomDataManager:
+        """Add several variables to the config at once. This only applies to the
+        implicit schema.
+
+        Works like calling ``add_variable_to_config`` for each item, but all the
+        variables are validated first and added with a single update, so nothing is
+        added if one of them fails.
+
+        Args:
+            variables: Mapping of statVar identifiers to a ``Variable`` or a dictionary
+                with the ``add_variable_to_config`` fields (name, description,
+                searchDescriptions, group, properties).
+            override: If True, overwrite existing variables. Defaults to False.
+        """
+
+        incoming = {
+            statVar: (
+                variable if isinstance(variable, Variable) else Variable(**variable)
+            )
+            for statVar, variable in variables.items()
+        }
+
+        # check if the config has a variables section
+        if self._config.variables is None:
+            self._config.variables = {}
+        # read back after assigning: validate_assignment may store a copy
+        existing = self._config.variables
+
+        if not override and not existing.keys().isdisjoint(incoming):
+            statVar = next(k for k in incoming if k in existing)
+            raise ValueError(
+                f"Variable '{statVar}' already exists. Use override=True to overwrite it."
+            )
+
+        existing.update(incoming)
+        return self
+
+    @staticmethod
+    def _input_file_name_check(file_name: str) -> None:
+        """Check that the input file name is a .csv file name"""
+        if not file_name.lower().endswith(".csv"):
+            raise ValueError(f'Input file key "{file_name}" must be a .csv file name')
+
     def _data_override_check(self, file_name: str, override: bool) -> None:
         """Check if the data already exists and override is not set"""
-        if file_name in self._data:
-            if not override:
-                raise ValueError(
-                    f"Data for file '{file_name}' already exists. "
-                    "Use a different name or set override as `True`."
-                )
+        if not override and file_name in self._data:
+            raise ValueError(
+                f"Data for file '{file_name}' already exists. "
+                "Use a different name or set override as `True`."
+            )
 
+    @_modifies_config
     def add_implicit_schema_file(
         self,
         file_name: str,
         provenance: str,
         entityType: str,
         data: Optional[pd.DataFrame] = None,
-        observationProperties: Dict[str, str] = None,
+        observationProperties: Dict[str, str] | ObservationProperties = None,
         ignoreColumns: Optional[List[str]] = None,
         override: bool = False,
     ) -> CustomDataManager:
@@ -592,15 +798,14 @@ class CustomDataManager:
                 to the config file.
             data: Data to register (optional)
             entityType: Type of the entity (optional)
-            observationProperties: Observation properties. Allowed keys
+            observationProperties: Observation properties, as a dictionary or an
+                ObservationProperties object. Allowed keys
                 are [unit, observationPeriod, scalingFactor, measurementMethod]
             ignoreColumns: List of columns to ignore (optional)
             override: If True, overwrite the existing file if it exists. Defaults to False.
         """
-        if observationProperties is None:
-            observationProperties = {}
-
-        # check if the file already exists
+        # check the file name, and whether the file already exists
+        self._input_file_name_check(file_name)
         self._data_override_check(file_name=file_name, override=override)
 
         # add the file to the config
@@ -608,7 +813,11 @@ class CustomDataManager:
             entityType=entityType,
             ignoreColumns=ignoreColumns,
             provenance=provenance,
-            observationProperties=ObservationProperties(**observationProperties),
+            observationProperties=(
+                observationProperties
+                if isinstance(observationProperties, ObservationProperties)
+                else ObservationProperties(**(observationProperties or {}))
+            ),
         )
 
         # if data is provided, register it
@@ -617,12 +826,13 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def add_explicit_schema_file(
         self,
         file_name: str,
         provenance: str,
         data: Optional[pd.DataFrame] = None,
-        columnMappings: Dict[str, str] = None,
+        columnMappings: Dict[str, str] | ColumnMappings = None,
         ignoreColumns: Optional[List[str]] = None,
         override: bool = False,
     ) -> CustomDataManager:
@@ -644,7 +854,8 @@ class CustomDataManager:
                 in the sources section of the config file. Use add_provenance to add a provenance
                 to the config file.
             data: Data to register (optional)
-            columnMappings: Column mappings. Match the headings in the CSV file to the allowed
+            columnMappings: Column mappings, as a dictionary or a ColumnMappings object.
+                Match the headings in the CSV file to the allowed
                 properties. Allowed keys are [entity, date, value, unit,
                 scalingFactor, measurementMethod, observationPeriod].
             ignoreColumns: List of columns to ignore (optional)
@@ -652,18 +863,19 @@ class CustomDataManager:
 
         """
 
-        # check if the file already exists
+        # check the file name, and whether the file already exists
+        self._input_file_name_check(file_name)
         self._data_override_check(file_name=file_name, override=override)
 
-        # ensure columnMappings is a dictionary
-        if columnMappings is None:
-            columnMappings = {}
-
         # add the file to the config
         self._config.inputFiles[file_name] = ExplicitSchemaFile(
             ignoreColumns=ignoreColumns,
             provenance=provenance,
-            columnMappings=ColumnMappings(**columnMappings),
+            columnMappings=(
+                columnMappings
+                if isinstance(columnMappings, ColumnMappings)
+                else ColumnMappings(**(columnMappings or {}))
+            ),
         )
 
         # if data is provided, register it
@@ -698,6 +910,7 @@ class CustomDataManager:
         self._data[file_name] = data
         return self
 
+    @_modifies_config
     def rename_variable(
         self, old_name: str, new_name: str, *, mcf_file_name: str | None = None
     ) -> CustomDataManager:
@@ -741,6 +954,7 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def rename_provenance(self, old_name: str, new_name: str) -> CustomDataManager:
         """Rename a provenance and update all references.
 
@@ -786,6 +1000,7 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def rename_source(self, old_name: str, new_name: str) -> CustomDataManager:
         """Rename a source key in the config.
 
@@ -807,6 +1022,7 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def remove_indicator(
         self, indicator_id: str, *, mcf_file_name: str | None = None
     ) -> CustomDataManager:
@@ -860,6 +1076,7 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def remove_by_provenance(self, provenance: str) -> CustomDataManager:
         """Remove all files and indicators associated with a provenance."""
 
@@ -895,6 +1112,7 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def remove_provenance(self, provenance: str) -> CustomDataManager:
         """Remove a provenance and any associated data and references."""
 
@@ -911,6 +1129,7 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def remove_by_source(self, source: str) -> CustomDataManager:
         """Remove all data associated with every provenance of a source."""
 
@@ -922,6 +1141,7 @@ class CustomDataManager:
 
         return self
 
+    @_modifies_config
     def remove_source(self, source: str) -> CustomDataManager:
         """Remove a source and all its provenances from the config and data."""
 
@@ -945,14 +1165,14 @@ class CustomDataManager:
         """
 
         # validate the config
-        self._config.validate_config()
+        self.validate_config()
 
-        # export the config to a JSON file
+        # export the config to a JSON file, streaming it to disk instead of
+        # building the whole document as one string first
+        data = self._config.model_dump(mode="json", exclude_none=True, by_alias=True)
         output_path = Path(dir_path) / "config.json"
         with output_path.open("w") as f:
-            f.write(
-                self._config.model_dump_json(indent=4, exclude_none=True, by_alias=True)
-            )
+            json.dump(data, f, indent=4, ensure_ascii=False)
 
     def export_mfc_file(
         self,
@@ -994,25 +1214,38 @@ class CustomDataManager:
         """
 
         # validate the config
-        self._config.validate_config()
+        self.validate_config()
 
         # export the config to a dictionary
         return self._config.model_dump(mode="json", exclude_none=True)
 
-    def export_data(self, dir_path: str | PathLike[str]) -> None:
+    def export_data(
+        self, dir_path: str | PathLike[str], max_workers: Optional[int] = None
+    ) -> None:
         """Export the data to CSV files
 
         Args:
             dir_path: Path to the directory where the data will be exported.
+            max_workers: Number of threads used to write the files. Defaults to one
+                per file, up to 8.
         """
 
         # check if there is any data
         if not self._data:
             raise ValueError("No data to export")
 
-        # export the data to CSV files
-        for file, data in self._data.items():
-            data.to_csv(Path(dir_path) / file, index=False)
+        # export the data to CSV files, one per thread so that disk writes
+        # (which release the GIL) overlap when there are several files
+        dir_path = Path(dir_path)
+        if max_workers is None:
+            max_workers = min(8, len(self._data))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(data.to_csv, dir_path / file, index=False)
+                for file, data in self._data.items()
+            ]
+            for future in futures:
+                future.result()
 
     def export_all(
         self,
@@ -1024,11 +1257,16 @@ class CustomDataManager:
 
         Args:
             dir_path: Path to the directory where the config and data will be exported.
+                It is created (with any missing parents) if it doesn't exist.
             override: If True, overwrite the files if they exist. Defaults to False.
             mcf_file_names: Name of the MCF file(s) to export (must end in .mcf).
                 Defaults to None, which means no MCF file will be exported.
         """
 
+        # build the path once and make sure the directory exists
+        dir_path = Path(dir_path)
+        dir_path.mkdir(parents=True, exist_ok=True)
+
         # export the config
         self.export_config(dir_path)
 
@@ -1054,10 +1292,13 @@ class CustomDataManager:
             pydantic.ValidationError if the config is not valid
         """
 
-        # validate the config
-        self._config.validate_config()
+        # validate the config, unless it hasn't changed since the last validation
+        if not self._config_validated:
+            self._config.validate_config()
+            self._config_validated = True
         return self
 
+    @_modifies_config
     def merge_config(
         self,
         config: Config | dict | str | PathLike[str],
@@ -1087,6 +1328,7 @@ class CustomDataManager:
         merge_configs(existing=self._config, new=cfg, policy=policy)
         return self
 
+    @_modifies_config
     def merge_configs_from_directory(
         self,
         directory: str | PathLike[str],
@@ -20,7 +20,7 @@ def _ensure_quoted(s: str) -> str:
     Returns:
         A string enclosed in double quotes, stripped of leading/trailing whitespace.
     """
-    if s.startswith("'") or s.startswith('"'):
+    if s.startswith(("'", '"')):
         s = s.strip('"').strip("'").strip()
     return f'"{s}"'
 
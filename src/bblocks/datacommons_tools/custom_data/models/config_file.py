@@ -1,3 +1,5 @@
+from os import PathLike
+from pathlib import Path
 from typing import Optional, Dict, Annotated
 
 from pydantic import BaseModel, ConfigDict, model_validator, Field
@@ -80,11 +82,15 @@ class Config(BaseModel):
         return self
 
     def validate_config(self) -> None:
-        """Validate the config"""
+        """Validate the config
+
+        The config is dumped and validated again from scratch, so changes made in
+        place to nested models (input files, sources, variables) are checked too.
+        """
         Config.model_validate(self.model_dump())
 
     @classmethod
-    def from_json(cls, file_path: str) -> "Config":
+    def from_json(cls, file_path: str | PathLike[str]) -> "Config":
         """Read the config from a JSON file
 
         Args:
@@ -94,6 +100,6 @@ class Config(BaseModel):
             Config: The config object.
         """
 
-        with open(file_path, "r") as f:
-            data = f.read()
-        return cls.model_validate_json(data)
+        # pydantic parses the raw bytes directly, so there's no need to decode
+        # the file into a str first
+        return cls.model_validate_json(Path(file_path).read_bytes())
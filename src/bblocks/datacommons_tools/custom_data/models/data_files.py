@@ -20,6 +20,15 @@ class MCFFileName(BaseModel):
     file_name: constr(strip_whitespace=True, pattern=r".*\.mcf$")
 
 
+def validate_mcf_file_name(file_name: str | MCFFileName) -> str:
+    name = (
+        MCFFileName(file_name=file_name).file_name
+        if isinstance(file_name, str)
+        else file_name
+    )
+    return name
+
+
 class ObservationProperties(BaseModel):
     """Representation of the ObservationProperties section of the InputFiles section of the config file
     This is for the implicit schema only.
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 from os import PathLike
 from pathlib import Path
-from typing import Optional, List
-
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+from typing import Iterable, Optional, List
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    model_validator,
+)
 
 from bblocks.datacommons_tools.custom_data.models.common import (
     QuotedStr,
@@ -77,6 +84,10 @@ class MCFNode(BaseModel):
         return "\n".join(lines) + "\n\n"
 
 
+_MCF_NODE_LIST = TypeAdapter(list[MCFNode])
+"""Validates all the blocks parsed from an MCF file in a single call."""
+
+
 class MCFNodes(BaseModel):
     """Represents a collection of Nodes.
 
@@ -101,8 +112,9 @@ class MCFNodes(BaseModel):
         except KeyError:
             raise ValueError(f"Node '{node_id}' not found.") from None
 
-    def _flush(self, block: dict[str, str]) -> None:
-        """Convert the current block into an `MCFNode` and store it."""
+    @staticmethod
+    def _flush(block: dict[str, str], blocks: list[dict[str, str]]) -> None:
+        """Move the current block to ``blocks`` and start a new one."""
         if not block:
             return
         if "Node" not in block:
@@ -110,7 +122,7 @@ class MCFNodes(BaseModel):
                 f"Missing mandatory 'Node:' line in block starting with "
                 f"{next(iter(block.items()))!r}"
             )
-        self.add(MCFNode(**block))
+        blocks.append(block.copy())
         block.clear()
 
     def load_from_mcf_file(self, file_path: str | PathLike) -> MCFNodes:
@@ -121,12 +133,16 @@ class MCFNodes(BaseModel):
         followed by one or more ``key: value`` lines, and is delimited
         by a blank line (or EOF).
 
+        All blocks are validated together once the whole file has been read,
+        so nothing is added to the collection if any of them is invalid.
+
         Args:
             file_path: The path of the MCF file to read.
         """
 
         path = Path(file_path)
         current_block: dict[str, str] = {}
+        blocks: list[dict[str, str]] = []
 
         with path.open(encoding="utf-8") as file_obj:
             for line_no, raw_line in enumerate(file_obj, start=1):
@@ -134,7 +150,7 @@ class MCFNodes(BaseModel):
 
                 # Blank line means end of current block
                 if not stripped:
-                    self._flush(current_block)
+                    self._flush(current_block, blocks)
                     continue
 
                 key, sep, value = stripped.partition(":")
@@ -145,9 +161,9 @@ class MCFNodes(BaseModel):
                 current_block[key.strip()] = value.strip()
 
         # Handle the final block if the file does not end with a blank line.
-        self._flush(current_block)
+        self._flush(current_block, blocks)
 
-        return self
+        return self.add_many(_MCF_NODE_LIST.validate_python(blocks))
 
     def add(self, node: MCFNode, override: bool = False) -> MCFNodes:
         """Adds a new node to the collection.
@@ -171,6 +187,42 @@ class MCFNodes(BaseModel):
 
         return self
 
+    def add_many(self, nodes: Iterable[MCFNode], override: bool = False) -> MCFNodes:
+        """Adds several nodes to the collection at once.
+
+        Conflicts are checked for the whole batch before any node is added, so
+        nothing is added if one of them fails.
+
+        Args:
+            nodes: The MCFNode instances to add.
+            override: If True, overwrite existing nodes with the same ID.
+                If False, raise an error if any node ID already exists
+                (in the collection or earlier in ``nodes``).
+        """
+        incoming: dict[str, MCFNode] = {}
+        for node in nodes:
+            if not override and node.Node in incoming:
+                raise ValueError(
+                    f"Node '{node.Node}' already exists; pass override=True to replace it."
+                )
+            incoming[node.Node] = node
+
+        if not override and not self._pos.keys().isdisjoint(incoming):
+            existing = next(node_id for node_id in incoming if node_id in self._pos)
+            raise ValueError(
+                f"Node '{existing}' already exists; pass override=True to replace it."
+            )
+
+        for node_id, node in incoming.items():
+            idx = self._pos.get(node_id)
+            if idx is None:
+                self._pos[node_id] = len(self.nodes)
+                self.nodes.append(node)
+            else:
+                self.nodes[idx] = node
+
+        return self
+
     def remove(self, node_id: str) -> MCFNodes:
         """Removes a node from the collection by its ID.
 
@@ -181,10 +233,9 @@ class MCFNodes(BaseModel):
         self.nodes.pop(idx)
         self._pos.pop(node_id)
 
-        # Update positions of all nodes after the removed node
-        for id_, pos in list(self._pos.items()):
-            if pos > idx:
-                self._pos[id_] = pos - 1
+        # Only the nodes after the removed one have moved
+        for pos in range(idx, len(self.nodes)):
+            self._pos[self.nodes[pos].Node] = pos
 
         return self
 
@@ -200,7 +251,6 @@ class MCFNodes(BaseModel):
         mode = "w" if override else "a"
 
         with open(file_path, mode) as f:
-            for node in self.nodes:
-                f.write(node.mcf)
+            f.writelines(node.mcf for node in self.nodes)
 
         return self
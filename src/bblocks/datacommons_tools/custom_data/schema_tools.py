@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import ast
+import os
 import re
+import shutil
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from enum import StrEnum
+from functools import lru_cache, partial
 from os import PathLike
 from pathlib import Path
-from typing import Any
+from typing import Any, Collection, Iterator
+from uuid import uuid4
 
 import pandas as pd
+from pydantic import TypeAdapter
 
-from bblocks.datacommons_tools.custom_data.models.data_files import MCFFileName
+from bblocks.datacommons_tools.custom_data.models.data_files import (
+    validate_mcf_file_name,
+)
 from bblocks.datacommons_tools.custom_data.models.mcf import MCFNodes, MCFNode
 from bblocks.datacommons_tools.custom_data.models.stat_vars import (
     StatVarMCFNode,
@@ -45,12 +55,28 @@ def _parse_maybe_list(s: str | Any) -> str | list[str]:
         return s
 
 
+_NODE_CLASSES: dict[str, type[MCFNode]] = {
+    "Node": MCFNode,
+    "StatVar": StatVarMCFNode,
+    "StatVarGroup": StatVarGroupMCFNode,
+    "Topic": TopicMCFNode,
+    "StatVarPeerGroup": StatVarPeerGroupMCFNode,
+}
+
+
+@lru_cache(maxsize=None)
+def _node_list_adapter(node_type: str) -> TypeAdapter[list[MCFNode]]:
+    """Return the (cached) adapter that validates a list of rows into nodes."""
+    return TypeAdapter(list[_NODE_CLASSES[node_type]])
+
+
 def _rows_to_stat_var_nodes(
     data: pd.DataFrame, node_type: str | NodeTypes = "StatVar"
 ) -> MCFNodes[StatVarMCFNode]:
     """Convert a DataFrame into a collection of Node objects (of the type selected).
 
     Empty/NA values are removed from each row before constructing the node.
+    All rows are validated in a single call.
 
     Args:
         data: A pandas ``DataFrame`` where every row describes a StatVar.
@@ -65,38 +91,38 @@ def _rows_to_stat_var_nodes(
 
     node_type = str(node_type)
 
-    records = data.to_dict(orient="records")
-    nodes = []
+    # Work out which cells to keep for the whole frame at once, then walk the
+    # rows as plain tuples instead of building a dict per row with to_dict
+    columns = data.columns.tolist()
+    keep = (data.notna() & data.ne("")).to_numpy()
+    records = [
+        {
+            column: _parse_maybe_list(value)
+            for column, value, keep_value in zip(columns, row, row_keep)
+            if keep_value
+        }
+        for row, row_keep in zip(data.itertuples(index=False, name=None), keep)
+    ]
 
-    constructor = {
-        "Node": MCFNode,
-        "StatVar": StatVarMCFNode,
-        "StatVarGroup": StatVarGroupMCFNode,
-        "Topic": TopicMCFNode,
-        "StatVarPeerGroup": StatVarPeerGroupMCFNode,
-    }
+    return MCFNodes(nodes=_node_list_adapter(node_type).validate_python(records))
 
-    for record in records:
-        record = {
-            k: _parse_maybe_list(v)
-            for k, v in record.items()
-            if not pd.isna(v) and v != ""
-        }
-        nodes.append(constructor[node_type](**record))
 
-    return MCFNodes(nodes=nodes)
+_DELIMITERS_RE = re.compile(r"[:,();&]")
+_ALL_UPPER_RE = re.compile(r"[A-Z0-9]+")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
+@lru_cache(maxsize=4096)
 def to_camelCase(segment: str) -> str:
     """
     Turn a segment like 'Official Development Assistance' into 'officialDevelopmentAssistance'.
     Keep all-upper or already-camel segments (e.g. DAC1, ODA) unchanged.
     """
     seg = segment.strip()
-    seg = re.sub(r"[:,();&]", "_", seg)
+    seg = _DELIMITERS_RE.sub("_", seg)
 
     # All upper case
-    if re.fullmatch(r"[A-Z0-9]+", seg):
+    if _ALL_UPPER_RE.fullmatch(seg):
         return seg
 
     # Already camel case
@@ -104,7 +130,7 @@ def to_camelCase(segment: str) -> str:
         return seg
 
     # Split by whitespace and join with camel case
-    words = re.split(r"\s+", seg)
+    words = _WHITESPACE_RE.split(seg)
     return words[0].lower() + "".join(w.title() for w in words[1:])
 
 
@@ -133,20 +159,23 @@ def build_stat_var_groups_from_strings(stat_vars, *, groups_namespace: str):
 
     group_nodes, seen = [], set()
     root = f"dcid:{groups_namespace}/g/"
+    # StatVars usually share a few paths, so each distinct path is only split
+    # and turned into groups once
+    deepest_group: dict[str, str] = {}
 
-    for node_idx, node in enumerate(stat_vars.nodes):
-        # clean
+    for node in stat_vars.nodes:
         raw = node.memberOf
-        raw = raw.lstrip("-").strip("/ ")
-        parts = [p for p in raw.split("/") if p]
+        if raw in deepest_group:
+            node.memberOf = deepest_group[raw]
+            continue
+
+        # clean
+        parts = [p for p in raw.lstrip("-").strip("/ ").split("/") if p]
         slug_parts = [to_camelCase(part) for part in parts]
 
         for idx, part in enumerate(parts):
             group_node = root + f"{slug_parts[idx]}"
 
-            if idx == len(parts) - 1:
-                stat_vars.nodes[node_idx].memberOf = group_node
-
             if group_node in seen:
                 continue
             seen.add(group_node)
@@ -160,18 +189,96 @@ def build_stat_var_groups_from_strings(stat_vars, *, groups_namespace: str):
                 StatVarGroupMCFNode(Node=group_node, name=part, specializationOf=parent)
             )
 
+        # A path with no groups leaves memberOf as it was
+        deepest_group[raw] = root + slug_parts[-1] if parts else raw
+        node.memberOf = deepest_group[raw]
+
     stat_vars.nodes.extend(group_nodes)
 
     return stat_vars
 
 
+_PARALLEL_CHUNKSIZE = 10_000
+
+
+def _iter_csv_frames(
+    file_path: str | PathLike[str],
+    csv_options: dict[str, Any],
+    ignore_columns: Collection[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield the CSV as a single DataFrame, or chunk by chunk if ``chunksize`` is set.
+
+    Columns in ``ignore_columns`` are skipped while parsing, unless the options
+    already select the columns to read with ``usecols``.
+    """
+    if ignore_columns and "usecols" not in csv_options:
+        ignored = frozenset(ignore_columns)
+        csv_options = {**csv_options, "usecols": lambda col: col not in ignored}
+
+    if not csv_options.get("chunksize"):
+        yield pd.read_csv(file_path, **csv_options)
+        return
+
+    with pd.read_csv(file_path, **csv_options) as reader:
+        yield from reader
+
+
+def _frame_to_nodes(
+    frame: pd.DataFrame,
+    *,
+    node_type: NodeTypes | str,
+    column_to_property_mapping: dict[str, str] | None,
+    ignore_columns: Collection[str] | None,
+) -> MCFNodes:
+    """Drop, rename and convert the columns of a metadata DataFrame into nodes."""
+    return (
+        frame.drop(columns=ignore_columns or [], errors="ignore")
+        .rename(columns=column_to_property_mapping or {})
+        .pipe(_rows_to_stat_var_nodes, node_type=node_type)
+    )
+
+
+def _frame_to_mcf(frame: pd.DataFrame, **kwargs) -> str:
+    """Convert a metadata DataFrame straight to MCF text.
+
+    Defined at module level so it can be sent to worker processes.
+    """
+    return "".join(node.mcf for node in _frame_to_nodes(frame, **kwargs).nodes)
+
+
+@contextmanager
+def _staged_mcf_file(mcf_path: Path, override: bool) -> Iterator[Path]:
+    """Yield a temporary file for the new nodes, moved into ``mcf_path`` on success.
+
+    The temporary file is created next to the real destination (symlinks are
+    resolved). With ``override`` it replaces the destination, keeping its
+    permissions; otherwise its content is appended to the destination. If the
+    block raises, the destination is left untouched.
+    """
+    target = mcf_path.resolve()
+    tmp_path = target.with_name(f".{target.name}.{uuid4().hex}.tmp")
+    try:
+        tmp_path.touch(exist_ok=False)
+        yield tmp_path
+        if not target.exists():
+            os.replace(tmp_path, target)
+        elif override:
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        else:
+            with open(tmp_path, "rb") as src, open(target, "ab") as dst:
+                shutil.copyfileobj(src, dst)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 def csv_metadata_to_nodes(
     file_path: str | Path,
     *,
     node_type: NodeTypes | str = "StatVar",
     column_to_property_mapping: dict[str, str] = None,
     csv_options: dict[str, Any] = None,
-    ignore_columns: list[str] = None,
+    ignore_columns: Collection[str] = None,
 ) -> MCFNodes[StatVarMCFNode]:
     """Read a CSV of StatVar metadata and return the corresponding MCF StatVar nodes.
 
@@ -181,37 +288,28 @@ def csv_metadata_to_nodes(
         column_to_property_mapping: Optional map from CSV column names to
             ``StatVarMCFNode`` attribute names.
         csv_options: Extra keyword arguments forwarded verbatim to
-            ``pandas.read_csv``.
-        ignore_columns: Optional list of columns to ignore when reading the CSV.
+            ``pandas.read_csv``. If ``chunksize`` is given, the file is read
+            and converted chunk by chunk.
+        ignore_columns: Optional collection of columns to ignore when reading the CSV.
 
     Returns:
         A ``Nodes`` container populated with ``StatVarMCFNode`` objects.
     """
 
-    if column_to_property_mapping is None:
-        column_to_property_mapping = {}
-
-    if csv_options is None:
-        csv_options = {}
+    chunks = [
+        _frame_to_nodes(
+            frame,
+            node_type=node_type,
+            column_to_property_mapping=column_to_property_mapping,
+            ignore_columns=ignore_columns,
+        )
+        for frame in _iter_csv_frames(file_path, csv_options or {}, ignore_columns)
+    ]
 
-    if ignore_columns is None:
-        ignore_columns = []
+    if len(chunks) == 1:
+        return chunks[0]
 
-    return (
-        pd.read_csv(file_path, **csv_options)
-        .drop(columns=ignore_columns)
-        .rename(columns=column_to_property_mapping)
-        .pipe(_rows_to_stat_var_nodes, node_type=node_type)
-    )
-
-
-def validate_mcf_file_name(file_name: str | MCFFileName) -> str:
-    name = (
-        MCFFileName(file_name=file_name).file_name
-        if isinstance(file_name, str)
-        else file_name
-    )
-    return name
+    return MCFNodes(nodes=[node for chunk in chunks for node in chunk.nodes])
 
 
 def csv_metadata_to_mfc_file(
@@ -221,8 +319,9 @@ def csv_metadata_to_mfc_file(
     *,
     column_to_property_mapping: dict[str, str] = None,
     csv_options: dict[str, Any] = None,
-    ignore_columns: list[str] = None,
+    ignore_columns: Collection[str] = None,
     override: bool = False,
+    max_workers: int = 1,
 ):
     """Convert a CSV of Node metadata to an MCF file.
 
@@ -231,21 +330,62 @@ def csv_metadata_to_mfc_file(
         mcf_path: Path to write the generated MCF file.
         node_type: The type of node to create (e.g., "StatVar", "StatVarGroup").
         column_to_property_mapping: Optional mapping from CSV columns to MCF properties.
-        csv_options: Extra options for reading the CSV file.
-        ignore_columns: List of columns to ignore when reading the CSV.
-        override: If True, overwrite the output file if it exists.
+        csv_options: Extra options for reading the CSV file. Pass ``chunksize`` to
+            read the CSV and write the MCF file chunk by chunk.
+        ignore_columns: Collection of columns to ignore when reading the CSV.
+        override: If True, overwrite the output file if it exists. Otherwise the
+            nodes are appended to it. Either way the output is only written once
+            the whole CSV has been converted, so a failure leaves it unchanged.
+        max_workers: Number of processes used to convert the CSV. With more than
+            one, the CSV is read in chunks (10,000 rows unless ``chunksize`` is
+            set in ``csv_options``) which are converted in parallel and written
+            in their original order.
 
     """
 
     mcf_path = Path(mcf_path)
     validate_mcf_file_name(mcf_path.name)
 
-    nodes = csv_metadata_to_nodes(
-        file_path=csv_path,
-        node_type=node_type,
-        column_to_property_mapping=column_to_property_mapping,
-        csv_options=csv_options,
-        ignore_columns=ignore_columns,
-    )
+    convert_kwargs = {
+        "node_type": node_type,
+        "column_to_property_mapping": column_to_property_mapping,
+        "ignore_columns": ignore_columns,
+    }
 
-    nodes.export_to_mcf_file(file_path=mcf_path, override=override)
+    if max_workers <= 1 and not (csv_options or {}).get("chunksize"):
+        # The whole CSV is converted before the output is opened, so a failure
+        # leaves it untouched
+        csv_metadata_to_nodes(
+            csv_path, csv_options=csv_options, **convert_kwargs
+        ).export_to_mcf_file(mcf_path, override=override)
+        return
+
+    if max_workers <= 1:
+        # Write each chunk as soon as it is converted. The new nodes only reach
+        # the output once every chunk has been written.
+        with (
+            _staged_mcf_file(mcf_path, override) as tmp_path,
+            open(tmp_path, "a") as f,
+        ):
+            for frame in _iter_csv_frames(csv_path, csv_options, ignore_columns):
+                f.write(_frame_to_mcf(frame, **convert_kwargs))
+        return
+
+    csv_options = {"chunksize": _PARALLEL_CHUNKSIZE, **(csv_options or {})}
+    convert = partial(_frame_to_mcf, **convert_kwargs)
+    # Keep only a few chunks in flight so memory stays bounded by the window,
+    # not by the size of the CSV (Executor.map would submit every chunk at once)
+    window = max_workers * 2
+    pending: deque[Future[str]] = deque()
+
+    with (
+        _staged_mcf_file(mcf_path, override) as tmp_path,
+        ProcessPoolExecutor(max_workers=max_workers) as executor,
+        open(tmp_path, "a") as f,
+    ):
+        for frame in _iter_csv_frames(csv_path, csv_options, ignore_columns):
+            if len(pending) >= window:
+                f.write(pending.popleft().result())
+            pending.append(executor.submit(convert, frame))
+        while pending:
+            f.write(pending.popleft().result())
@@ -2,12 +2,11 @@ import io
 import json
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable, Sequence, Any
 from urllib.parse import urlparse
 
-import pandas as pd
-
 from bblocks.datacommons_tools.custom_data.models.config_file import Config
 
 from google.cloud.storage import Bucket
@@ -22,16 +21,29 @@ _VALID_EXTENSIONS = {".csv", ".json", ".mcf"}
 def _iter_local_files(directory: Path) -> Iterable[Path]:
     """Yield all the files to be uploaded (excluding the skipped ones in subdirectories)
 
+    The directory is walked with ``os.scandir`` so the file/directory checks
+    use the cached directory entry instead of a ``stat`` call per path.
+
     Args:
         directory (Path): The directory to iterate through.
 
     """
-    for path in directory.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.parent != directory and path.suffix in _SKIP_IN_SUBDIR:
-            continue
-        yield path
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                    continue
+                if not entry.is_file():
+                    continue
+                if (
+                    current is not directory
+                    and os.path.splitext(entry.name)[1] in _SKIP_IN_SUBDIR
+                ):
+                    continue
+                yield Path(entry.path)
 
 
 def _normalize_gcs_prefix(bucket: Bucket, prefix: str | None) -> str | None:
@@ -68,7 +80,10 @@ def _normalize_gcs_prefix(bucket: Bucket, prefix: str | None) -> str | None:
 
 
 def upload_directory_to_gcs(
-    bucket: Bucket, directory: Path, gcs_folder_name: str | None = None
+    bucket: Bucket,
+    directory: Path,
+    gcs_folder_name: str | None = None,
+    max_workers: int = 8,
 ) -> None:
     """Upload a local directory to Google Cloud Storage. Folder structures
     is maintained in the GCS bucket in a specified base folder
@@ -79,6 +94,7 @@ def upload_directory_to_gcs(
         gcs_folder_name (str | None): Name of the base folder in the GCS bucket
             to store the data. If ``None``, files are uploaded to the bucket
             root while maintaining the directory structure.
+        max_workers (int): Number of files uploaded concurrently. Defaults to 8.
 
     Raises:
         FileNotFoundError: If the specified directory does not exist.
@@ -86,7 +102,7 @@ def upload_directory_to_gcs(
     if not directory.exists():
         raise FileNotFoundError(f"The directory {directory} does not exist.")
 
-    files_uploaded = 0
+    uploads: list[tuple[Path, str]] = []
 
     for local_path in _iter_local_files(directory):
         if local_path.suffix not in _VALID_EXTENSIONS:
@@ -96,14 +112,21 @@ def upload_directory_to_gcs(
         remote_path = (
             f"{gcs_folder_name}/{relative}" if gcs_folder_name else str(relative)
         )
+        uploads.append((local_path, remote_path))
+
+    def _upload(local_path: Path, remote_path: str) -> tuple[Path, str]:
         bucket.blob(remote_path).upload_from_filename(str(local_path))
-        logger.info(f"Uploaded {local_path} to {remote_path}")
-        files_uploaded += 1
+        return local_path, remote_path
+
+    # Uploads are network-bound, so several of them can run at once
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_upload, *upload) for upload in uploads]
+        for future in as_completed(futures):
+            local_path, remote_path = future.result()
+            logger.info(f"Uploaded {local_path} to {remote_path}")
 
     dest = gcs_folder_name if gcs_folder_name else "root"
-    logger.info(
-        f"Uploaded {files_uploaded} files to {dest} in GCS bucket {bucket.name}"
-    )
+    logger.info(f"Uploaded {len(uploads)} files to {dest} in GCS bucket {bucket.name}")
 
 
 def list_bucket_files(bucket: Bucket, gcs_folder_name: str | None = None) -> list[str]:
@@ -236,6 +259,8 @@ def get_bucket_files(
         raw = bucket.blob(name).download_as_bytes()
         ext = Path(name).suffix.lower()
         if ext == ".csv":
+            import pandas as pd
+
             results[name] = pd.read_csv(io.BytesIO(raw))
         elif ext == ".json":
             results[name] = json.loads(raw.decode("utf-8"))
@@ -1,5 +1,87 @@
+import errno
+import os
+import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
+
+import pytest
+
 from bblocks.datacommons_tools.cli import main
+from bblocks.datacommons_tools.cli.csv2mcf import _NODE_TYPE_CHOICES, fast_parse
+from bblocks.datacommons_tools.cli.main import _build_parser
+from bblocks.datacommons_tools.custom_data import schema_tools
+from bblocks.datacommons_tools.custom_data.schema_tools import NodeTypes
+
+
+def test_node_type_choices_match_enum() -> None:
+    assert _NODE_TYPE_CHOICES == tuple(node_type.value for node_type in NodeTypes)
+
+
+def test_cli_import_does_not_load_pandas() -> None:
+    code = "import sys, bblocks.datacommons_tools.cli; print('pandas' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["csv2mcf", "in.csv", "out.mcf"],
+        [
+            "csv2mcf",
+            "in.csv",
+            "--column-mapping",
+            "a=b",
+            "out.mcf",
+            "--csv-option",
+            "delimiter=;",
+            "--ignore-column",
+            "x",
+            "--node-type",
+            "StatVar",
+            "--chunksize",
+            "10",
+            "--jobs",
+            "2",
+            "--override",
+        ],
+        [
+            "csv2mcf",
+            "in.csv",
+            "out.mcf",
+            "--column-mapping",
+            "a=b",
+            "--column-mapping",
+            "c=d",
+            "--column-mapping",
+            "a=e",
+            "--ignore-column",
+            "x",
+            "--ignore-column",
+            "y",
+            "--csv-option",
+            "sep=,",
+            "--csv-option",
+            "sep=;",
+        ],
+        ["csv2mcf", "in.csv", "out.mcf", "--csv-option", "na_values=a=b"],
+    ],
+    ids=["defaults", "all-options", "repeated-options", "value-with-equals"],
+)
+def test_fast_parse_matches_argparse(argv: list[str]) -> None:
+    assert fast_parse(argv) == _build_parser().parse_args(argv)
+
+
+def test_fast_parse_falls_back() -> None:
+    assert fast_parse(["csv2mcf", "--help"]) is None
+    assert fast_parse(["csv2mcf", "in.csv", "out.mcf", "--node-type=StatVar"]) is None
+    assert fast_parse(["csv2mcf", "in.csv", "out.mcf", "--node-type", "Bad"]) is None
+    assert fast_parse(["csv2mcf", "in.csv"]) is None
+    assert fast_parse(["upload"]) is None
 
 
 def test_csv2mcf(tmp_path: Path) -> None:
@@ -77,3 +159,129 @@ def test_csv2mcf_append_and_override(tmp_path: Path) -> None:
     content_over = out_mcf.read_text()
     assert "Node: dcid:sv1" in content_over
     assert "Node: dcid:sv2" not in content_over
+
+
+def test_csv2mcf_fails_fast_on_bad_paths(tmp_path: Path) -> None:
+    csv = tmp_path / "sv.csv"
+    with pytest.raises(FileNotFoundError):
+        main(["csv2mcf", str(csv), str(tmp_path / "out.mcf")])
+    csv.write_text("Node,name\ndcid:sv1,SV1\n")
+    with pytest.raises(ValueError):
+        main(["csv2mcf", str(csv), str(tmp_path / "out.txt")])
+
+
+def _write_to_fifo(fifo: Path, data: bytes, timeout: float = 10) -> None:
+    """Write ``data`` to ``fifo`` once it has a reader, giving up after ``timeout``."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            # Non-blocking, so the open fails (ENXIO) instead of waiting forever
+            # for a reader that may never come
+            fd = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+            break
+        except OSError as e:
+            if e.errno != errno.ENXIO or time.monotonic() > deadline:
+                raise
+            time.sleep(0.01)
+    try:
+        os.set_blocking(fd, True)
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_csv2mcf_reads_from_pipe(tmp_path: Path) -> None:
+    fifo = tmp_path / "sv.csv"
+    os.mkfifo(fifo)
+    writer = threading.Thread(
+        target=_write_to_fifo,
+        args=(fifo, b"Node,name,typeOf\ndcid:sv1,SV1,dcid:StatisticalVariable\n"),
+        daemon=True,
+    )
+    writer.start()
+    out = tmp_path / "out.mcf"
+    try:
+        assert main(["csv2mcf", str(fifo), str(out)]) == 0
+    finally:
+        writer.join(timeout=10)
+    assert "Node: dcid:sv1" in out.read_text()
+
+
+@pytest.mark.skipif(not Path("/dev/fd").is_dir(), reason="requires /dev/fd")
+def test_csv2mcf_reads_from_fd(tmp_path: Path) -> None:
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"Node,name,typeOf\ndcid:sv1,SV1,dcid:StatisticalVariable\n")
+    os.close(write_fd)
+    out = tmp_path / "out.mcf"
+    try:
+        assert main(["csv2mcf", f"/dev/fd/{read_fd}", str(out)]) == 0
+    finally:
+        os.close(read_fd)
+    assert "Node: dcid:sv1" in out.read_text()
+
+
+@pytest.mark.parametrize(
+    "csv_option, expected",
+    [
+        ([], {"low_memory": False}),
+        (["engine=c"], {"engine": "c", "low_memory": False}),
+        (["engine=python"], {"engine": "python"}),
+    ],
+)
+def test_csv2mcf_low_memory_default(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    csv_option: list[str],
+    expected: dict[str, object],
+) -> None:
+    csv = tmp_path / "sv.csv"
+    csv.write_text("Node,name,typeOf\ndcid:sv1,SV1,dcid:StatisticalVariable\n")
+    calls = []
+    monkeypatch.setattr(
+        schema_tools, "csv_metadata_to_mfc_file", lambda **kwargs: calls.append(kwargs)
+    )
+    argv = ["csv2mcf", str(csv), str(tmp_path / "out.mcf")]
+    for option in csv_option:
+        argv += ["--csv-option", option]
+    args = _build_parser().parse_args(argv)
+    parsed_options = dict(args.csv_option or {})
+
+    assert args.func(args) == 0
+    assert calls[0]["csv_options"] == expected
+    # The parsed namespace is left as the user gave it
+    assert (args.csv_option or {}) == parsed_options
+
+
+def test_csv2mcf_chunksize(tmp_path: Path) -> None:
+    csv = tmp_path / "sv.csv"
+    csv.write_text(
+        "Node,name,typeOf\n"
+        "dcid:sv1,SV1,dcid:StatisticalVariable\n"
+        "dcid:sv2,SV2,dcid:StatisticalVariable\n"
+        "dcid:sv3,SV3,dcid:StatisticalVariable\n"
+    )
+    out_mcf = tmp_path / "out.mcf"
+    out_mcf.write_text("stale")
+    exit_code = main(
+        ["csv2mcf", str(csv), str(out_mcf), "--chunksize", "2", "--override"]
+    )
+    assert exit_code == 0
+    content = out_mcf.read_text()
+    assert "stale" not in content
+    for sv in ("sv1", "sv2", "sv3"):
+        assert content.count(f"Node: dcid:{sv}") == 1
+
+
+def test_csv2mcf_jobs(tmp_path: Path) -> None:
+    csv = tmp_path / "sv.csv"
+    rows = "".join(f"dcid:sv{i},SV{i},dcid:StatisticalVariable\n" for i in range(5))
+    csv.write_text("Node,name,typeOf\n" + rows)
+    out_mcf = tmp_path / "out.mcf"
+    exit_code = main(
+        ["csv2mcf", str(csv), str(out_mcf), "--chunksize", "2", "--jobs", "2"]
+    )
+    assert exit_code == 0
+    content = out_mcf.read_text()
+    positions = [content.index(f"Node: dcid:sv{i}\n") for i in range(5)]
+    assert positions == sorted(positions)
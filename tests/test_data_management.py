@@ -1,14 +1,23 @@
+import subprocess
+import sys
+
 import pandas as pd
 import pytest
+from pydantic import HttpUrl
 
 from bblocks.datacommons_tools import CustomDataManager
-from bblocks.datacommons_tools.custom_data.data_management import DEFAULT_GROUP_NAME
+from bblocks.datacommons_tools.custom_data.data_management import (
+    DEFAULT_GROUP_NAME,
+    DEFAULT_STATVAR_MCF_NAME,
+)
 from bblocks.datacommons_tools.custom_data.models.config_file import Config
 from bblocks.datacommons_tools.custom_data.models.data_files import (
+    ColumnMappings,
     ImplicitSchemaFile,
     ObservationProperties,
 )
 from bblocks.datacommons_tools.custom_data.models.sources import Source
+from bblocks.datacommons_tools.custom_data.models.stat_vars import Variable
 
 
 def test_custom_data_manager_add_provenance_and_override():
@@ -183,6 +192,37 @@ def test_export_methods(tmp_path):
     assert "Node: dcid:vX" in mcf_file.read_text()
 
 
+@pytest.mark.parametrize("max_workers", [None, 1])
+def test_export_data_writes_every_file(tmp_path, max_workers):
+    """Each registered DataFrame is written to its own CSV file."""
+    manager = CustomDataManager()
+    manager.add_provenance("p1", "http://prov", "s1", source_url="http://src")
+    frames = {f"data{i}.csv": pd.DataFrame({"A": [i, i + 1]}) for i in range(10)}
+    for file_name, df in frames.items():
+        manager.add_implicit_schema_file(
+            file_name=file_name, provenance="p1", data=df, entityType="Country"
+        )
+
+    manager.export_data(tmp_path, max_workers=max_workers)
+
+    for file_name, df in frames.items():
+        pd.testing.assert_frame_equal(pd.read_csv(tmp_path / file_name), df)
+
+
+def test_add_variable_to_mcf_additional_properties():
+    """Unset arguments are dropped and additional properties are merged in."""
+    manager = CustomDataManager()
+    manager.add_variable_to_mcf(
+        Node="dcid:vA",
+        name="VA",
+        description=None,
+        additional_properties={"footnote": "Note"},
+    )
+    node = manager._mcf_nodes[DEFAULT_STATVAR_MCF_NAME].nodes[0]
+    assert node.description is None
+    assert node.footnote == "Note"
+
+
 def test_add_variable_group_to_mcf_and_override():
     """
     Checks StatVarGroup node addition and override behavior.
@@ -494,3 +534,174 @@ def test_rename_variable_and_source_methods():
         manager.rename_source("unknown", "x")
     with pytest.raises(ValueError):
         manager.rename_source("s2", "s2")
+
+
+def test_validate_config_skipped_until_config_changes(monkeypatch):
+    """Validation runs once per change to the config, not once per export."""
+    calls = []
+    original = Config.validate_config
+    monkeypatch.setattr(
+        Config, "validate_config", lambda self: calls.append(1) or original(self)
+    )
+
+    manager = CustomDataManager()
+    manager.add_provenance("p1", "http://prov", "s1", source_url="http://src")
+    manager.config_to_dict()
+    manager.validate_config()
+    assert len(calls) == 1
+
+    manager.set_includeInputSubdirs(True)
+    manager.config_to_dict()
+    assert len(calls) == 2
+
+
+def test_add_provenance_accepts_validated_url():
+    """An HttpUrl is stored as given; a string is parsed into one."""
+    manager = CustomDataManager()
+    manager.add_provenance("p1", "http://prov", "s1", source_url="http://src")
+
+    url = HttpUrl("http://prov2")
+    manager.add_provenance("p2", url, "s1")
+    manager.add_provenance("p3", "http://prov3", "s1")
+
+    provs = manager._config.sources["s1"].provenances
+    assert provs["p2"] is url
+    assert provs["p3"] == HttpUrl("http://prov3")
+
+
+def test_export_all_creates_directory(tmp_path):
+    """export_all creates the target directory and writes every output to it."""
+    manager = CustomDataManager()
+    manager.add_provenance("p1", "http://prov", "s1", source_url="http://src")
+    manager.add_implicit_schema_file(
+        file_name="data.csv",
+        provenance="p1",
+        data=pd.DataFrame({"A": [1]}),
+        entityType="Country",
+    )
+    manager.add_variable_to_mcf(Node="dcid:vX", name="VX")
+    out = tmp_path / "nested" / "out"
+
+    manager.export_all(out, mcf_file_names=DEFAULT_STATVAR_MCF_NAME)
+
+    assert sorted(p.name for p in out.iterdir()) == [
+        "config.json",
+        DEFAULT_STATVAR_MCF_NAME,
+        "data.csv",
+    ]
+
+
+def test_mcf_only_manager_does_not_load_pandas():
+    """pandas is only imported once a CSV or DataFrame is involved."""
+    code = (
+        "import sys\n"
+        "from bblocks.datacommons_tools import CustomDataManager\n"
+        "CustomDataManager().add_variable_to_mcf(Node='dcid:v', name='V')\n"
+        "print('pandas' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_add_provenances_bulk():
+    """Bulk provenances are grouped per source and checked before any is added."""
+    manager = CustomDataManager()
+    manager.add_provenance("p1", "http://prov", "s1", source_url="http://src")
+
+    manager.add_provenances(
+        [
+            ("p2", "http://prov2", "s1"),
+            ("p3", "http://prov3", "s2", "http://src2"),
+            ("p4", "http://prov4", "s2"),
+        ]
+    )
+    assert set(manager._config.sources["s1"].provenances) == {"p1", "p2"}
+    assert set(manager._config.sources["s2"].provenances) == {"p3", "p4"}
+
+    with pytest.raises(ValueError, match="p1"):
+        manager.add_provenances(
+            [("p5", "http://prov5", "s1"), ("p1", "http://x", "s1")]
+        )
+    with pytest.raises(ValueError, match="s3"):
+        manager.add_provenances([("p6", "http://prov6", "s3")])
+    assert "p5" not in manager._config.sources["s1"].provenances
+
+    manager.add_provenances([("p1", "http://new", "s1")], override=True)
+    assert manager._config.sources["s1"].provenances["p1"] == HttpUrl("http://new")
+
+
+def test_add_provenances_rejects_malformed_and_conflicting_items():
+    """Items must have 3 or 4 elements and a new source only one URL."""
+    manager = CustomDataManager()
+
+    with pytest.raises(ValueError, match="Expected"):
+        manager.add_provenances([("p1", "http://prov", "s1", "http://src", "extra")])
+    with pytest.raises(ValueError, match="Expected"):
+        manager.add_provenances([("p1", "http://prov")])
+
+    with pytest.raises(ValueError, match="conflicting URLs"):
+        manager.add_provenances(
+            [
+                ("p1", "http://prov1", "s1", "http://src-a"),
+                ("p2", "http://prov2", "s1", "http://src-b"),
+            ]
+        )
+    assert manager._config.sources == {}
+
+    # Repeating the same source URL is fine
+    manager.add_provenances(
+        [
+            ("p1", "http://prov1", "s1", "http://src-a"),
+            ("p2", "http://prov2", "s1", "http://src-a"),
+        ]
+    )
+    assert set(manager._config.sources["s1"].provenances) == {"p1", "p2"}
+
+
+def test_add_variables_to_config_bulk():
+    """Bulk variables are validated first and added in one update."""
+    manager = CustomDataManager()
+    manager.add_variables_to_config(
+        {"v1": {"name": "Var1"}, "v2": Variable(name="Var2", group="G")}
+    )
+    assert manager._config.variables["v1"].name == "Var1"
+    assert manager._config.variables["v2"].group == "G"
+
+    with pytest.raises(ValueError, match="v1"):
+        manager.add_variables_to_config({"v3": {"name": "Var3"}, "v1": {"name": "X"}})
+    assert "v3" not in manager._config.variables
+
+    manager.add_variables_to_config({"v1": {"name": "New"}}, override=True)
+    assert manager._config.variables["v1"].name == "New"
+
+
+def test_schema_files_accept_model_instances():
+    """Observation properties and column mappings can be passed as models."""
+    manager = CustomDataManager()
+    manager.add_provenance("p1", "http://prov", "s1", source_url="http://src")
+
+    props = ObservationProperties(unit="U")
+    manager.add_implicit_schema_file(
+        "imp.csv", provenance="p1", entityType="Country", observationProperties=props
+    )
+    mappings = ColumnMappings(entity="Country")
+    manager.add_explicit_schema_file(
+        "exp.csv", provenance="p1", columnMappings=mappings
+    )
+
+    assert manager._config.inputFiles["imp.csv"].observationProperties is props
+    assert manager._config.inputFiles["exp.csv"].columnMappings is mappings
+
+
+def test_schema_files_require_csv_name():
+    """Non-CSV file names are rejected when the input file is added."""
+    manager = CustomDataManager()
+    manager.add_provenance("p1", "http://prov", "s1", source_url="http://src")
+
+    with pytest.raises(ValueError, match="must be a .csv file"):
+        manager.add_implicit_schema_file("data.txt", provenance="p1", entityType="C")
+    with pytest.raises(ValueError, match="must be a .csv file"):
+        manager.add_explicit_schema_file("data.json", provenance="p1")
+    assert manager._config.inputFiles == {}
@@ -1,6 +1,9 @@
 import pytest
+from pydantic import ValidationError
 
 from bblocks.datacommons_tools.custom_data.models.config_file import Config
+from bblocks.datacommons_tools.custom_data.models.data_files import ImplicitSchemaFile
+from bblocks.datacommons_tools.custom_data.models.sources import Source
 
 
 def test_config_validators_raise_on_invalid_input_files(tmp_path):
@@ -26,3 +29,51 @@ def test_config_validators_raise_on_invalid_input_files(tmp_path):
     )
     with pytest.raises(ValueError):
         Config.from_json(str(config2))
+
+
+def test_validate_config_catches_in_place_changes():
+    """Changes that bypass validate_assignment are caught by validate_config."""
+    cfg = Config(
+        inputFiles={},
+        sources={"s": Source(url="http://s.com", provenances={"p": "http://p.com"})},
+    )
+    cfg.validate_config()
+
+    cfg.inputFiles["file.txt"] = ImplicitSchemaFile(
+        entityType="Country", provenance="p", observationProperties={}
+    )
+    with pytest.raises(ValidationError, match="must be a .csv file"):
+        cfg.validate_config()
+
+    del cfg.inputFiles["file.txt"]
+    cfg.inputFiles["file.csv"] = ImplicitSchemaFile(
+        entityType="Country", provenance="missing", observationProperties={}
+    )
+    with pytest.raises(ValidationError, match="unknown provenance"):
+        cfg.validate_config()
+
+
+# Dumping the invalid values makes pydantic warn before validation fails
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_validate_config_catches_in_place_nested_changes():
+    """Changes made inside nested models are caught by validate_config."""
+    cfg = Config(
+        inputFiles={
+            "file.csv": ImplicitSchemaFile(
+                entityType="Country", provenance="p", observationProperties={}
+            )
+        },
+        sources={"s": Source(url="http://s.com", provenances={"p": "http://p.com"})},
+    )
+    cfg.validate_config()
+
+    cfg.sources["s"].provenances["x"] = "not a url"
+    with pytest.raises(ValidationError):
+        cfg.validate_config()
+
+    del cfg.sources["s"].provenances["x"]
+    cfg.validate_config()
+
+    cfg.inputFiles["file.csv"].entityType = 5
+    with pytest.raises(ValidationError):
+        cfg.validate_config()
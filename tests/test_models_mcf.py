@@ -94,6 +94,21 @@ def test_mcfnodes_load_from_file_without_name(tmp_path):
     assert first.typeOf == "dcid:TypeA"
 
 
+def test_mcfnodes_load_from_file_invalid_block_adds_nothing(tmp_path):
+    """
+    A block that fails validation should leave the collection unchanged.
+    """
+    path = tmp_path / "nodes.mcf"
+    path.write_text(
+        "Node: dcid:Good\ntypeOf: dcid:TypeA\n\nNode: not a dcid\ntypeOf: dcid:TypeA\n"
+    )
+
+    nodes = MCFNodes()
+    with pytest.raises(ValueError):
+        nodes.load_from_mcf_file(path)
+    assert nodes.nodes == []
+
+
 def test_mcfnodes_add_override_and_remove():
     """
     Tests adding nodes, override behavior, and removal from MCFNodes.
@@ -116,3 +131,46 @@ def test_mcfnodes_add_override_and_remove():
     nodes.remove("dcid:n1")
     with pytest.raises(ValueError):
         nodes._expect_present("n1")
+
+
+def test_mcfnodes_remove_keeps_positions_in_sync():
+    """
+    Tests that removing a node shifts the indexed positions of later nodes only.
+    """
+    nodes = MCFNodes(
+        nodes=[MCFNode(Node=f"dcid:n{i}", typeOf="dcid:T") for i in range(4)]
+    )
+
+    nodes.remove("dcid:n1")
+
+    assert [n.Node for n in nodes.nodes] == ["dcid:n0", "dcid:n2", "dcid:n3"]
+    assert nodes._pos == {"dcid:n0": 0, "dcid:n2": 1, "dcid:n3": 2}
+
+
+def test_mcfnodes_add_many():
+    """
+    Tests bulk addition, override behaviour and that a conflict adds nothing.
+    """
+    nodes = MCFNodes()
+    nodes.add(MCFNode(Node="dcid:n1", typeOf="dcid:T1"))
+
+    batch = [
+        MCFNode(Node="dcid:n2", typeOf="dcid:T1"),
+        MCFNode(Node="dcid:n1", name='"New"', typeOf="dcid:T1"),
+    ]
+    with pytest.raises(ValueError, match="dcid:n1"):
+        nodes.add_many(batch)
+    assert [n.Node for n in nodes.nodes] == ["dcid:n1"]
+
+    with pytest.raises(ValueError, match="dcid:n3"):
+        nodes.add_many(
+            [
+                MCFNode(Node="dcid:n3", typeOf="dcid:T1"),
+                MCFNode(Node="dcid:n3", typeOf="dcid:T2"),
+            ]
+        )
+
+    nodes.add_many(batch, override=True)
+    assert [n.Node for n in nodes.nodes] == ["dcid:n1", "dcid:n2"]
+    assert nodes.nodes[0].name == '"New"'
+    assert nodes._expect_present("dcid:n2") == 1
@@ -1,6 +1,11 @@
 import pandas as pd
+import pytest
+from pydantic import ValidationError
 
-from bblocks.datacommons_tools.custom_data.models.stat_vars import StatVarMCFNode
+from bblocks.datacommons_tools.custom_data.models.stat_vars import (
+    StatVarGroupMCFNode,
+    StatVarMCFNode,
+)
 from bblocks.datacommons_tools.custom_data.schema_tools import _rows_to_stat_var_nodes
 
 
@@ -63,3 +68,35 @@ def test_rows_to_stat_var_nodes_parses_spreadsheet_lists_no_quotes():
     nodes = _rows_to_stat_var_nodes(df)
     mcf = nodes.nodes[0].mcf
     assert "memberOf: dcid:oneId, dcid:twoId" in mcf
+
+
+def test_rows_to_stat_var_nodes_uses_selected_node_type():
+    df = pd.DataFrame(
+        {
+            "Node": ["dcid:one/g/a", "dcid:one/g/b"],
+            "name": ["A", "B"],
+            "specializationOf": ["dcid:dc/g/Root", "dcid:one/g/a"],
+        }
+    )
+    nodes = _rows_to_stat_var_nodes(df, node_type="StatVarGroup")
+    assert [type(n) for n in nodes.nodes] == [StatVarGroupMCFNode] * 2
+    assert [n.Node for n in nodes.nodes] == ["dcid:one/g/a", "dcid:one/g/b"]
+
+
+def test_rows_to_stat_var_nodes_reports_invalid_row():
+    df = pd.DataFrame({"Node": ["dcid:ok", "not a dcid"], "name": ["A", "B"]})
+    with pytest.raises(ValidationError, match=r"1\.Node"):
+        _rows_to_stat_var_nodes(df)
+
+
+def test_rows_to_stat_var_nodes_drops_missing_and_empty_cells():
+    df = pd.DataFrame(
+        {
+            "Node": ["dcid:n1", "dcid:n2"],
+            "name": ["Var", ""],
+            "description": [None, "Second"],
+        }
+    )
+    first, second = _rows_to_stat_var_nodes(df).nodes
+    assert (first.name, first.description) == ("Var", None)
+    assert (second.name, second.description) == (None, "Second")
@@ -1,3 +1,8 @@
+import os
+
+import pytest
+from pydantic import ValidationError
+
 from bblocks.datacommons_tools.custom_data.models.mcf import MCFNodes
 from bblocks.datacommons_tools.custom_data.models.stat_vars import (
     StatVarMCFNode,
@@ -5,6 +10,7 @@ from bblocks.datacommons_tools.custom_data.models.stat_vars import (
 )
 from bblocks.datacommons_tools.custom_data.schema_tools import (
     csv_metadata_to_nodes,
+    csv_metadata_to_mfc_file,
     build_stat_var_groups_from_strings,
     to_camelCase,
 )
@@ -34,6 +40,21 @@ def test_csv_metadata_to_nodes(tmp_path):
     for node in nodes_map.nodes:
         assert hasattr(node, "searchDescription")
 
+    chunked = csv_metadata_to_nodes(str(csv_path), csv_options={"chunksize": 1})
+    assert [n.Node for n in chunked.nodes] == [n.Node for n in nodes.nodes]
+
+
+def test_csv_metadata_to_nodes_ignored_columns_are_not_read(tmp_path):
+    csv_path = tmp_path / "test.csv"
+    csv_path.write_text("Node,name,extra\n" "dcid:n1,Name1,a\n" "dcid:n2,Name2,b\n")
+
+    for options in ({}, {"chunksize": 1}):
+        nodes = csv_metadata_to_nodes(
+            csv_path, csv_options=options, ignore_columns=["extra", "missing"]
+        )
+        assert [n.Node for n in nodes.nodes] == ["dcid:n1", "dcid:n2"]
+        assert all(not hasattr(n, "extra") for n in nodes.nodes)
+
 
 def make_sv(member_of: str) -> StatVarMCFNode:
     """Helper to create a StatVarMCFNode with a given memberOf path."""
@@ -52,6 +73,114 @@ def get_statvar_nodes(nodes: MCFNodes) -> list[StatVarMCFNode]:
     return [n for n in nodes.nodes if isinstance(n, StatVarMCFNode)]
 
 
+@pytest.mark.parametrize("max_workers", [1, 2])
+@pytest.mark.parametrize("override", [True, False])
+def test_csv_metadata_to_mfc_file_failure_keeps_existing_file(
+    tmp_path, override, max_workers
+):
+    """A chunk that fails to convert must not truncate or partly append the output."""
+    csv = tmp_path / "sv.csv"
+    csv.write_text(
+        "Node,name,typeOf\n"
+        "dcid:n1,Name1,dcid:StatisticalVariable\n"
+        "dcid:n2,Name2,dcid:Topic\n"
+    )
+    mcf = tmp_path / "out.mcf"
+    mcf.write_text("Node: dcid:existing\n\n")
+
+    with pytest.raises(ValidationError):
+        csv_metadata_to_mfc_file(
+            csv,
+            mcf,
+            "StatVar",
+            csv_options={"chunksize": 1},
+            override=override,
+            max_workers=max_workers,
+        )
+
+    assert mcf.read_text() == "Node: dcid:existing\n\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.mcf", "sv.csv"]
+
+
+_WRITE_PATHS = [
+    pytest.param({}, 1, id="whole-file"),
+    pytest.param({"chunksize": 1}, 1, id="chunked"),
+    pytest.param({"chunksize": 1}, 2, id="parallel"),
+]
+
+
+@pytest.mark.parametrize("csv_options, max_workers", _WRITE_PATHS)
+def test_csv_metadata_to_mfc_file_writes_through_symlink(
+    tmp_path, csv_options, max_workers
+):
+    """A symlinked output keeps pointing at its target, which gets the nodes."""
+    csv = tmp_path / "sv.csv"
+    csv.write_text("Node,name\ndcid:n1,Name1\ndcid:n2,Name2\n")
+    target = tmp_path / "real.mcf"
+    target.write_text("Node: dcid:existing\n\n")
+    link = tmp_path / "out.mcf"
+    link.symlink_to(target)
+
+    for override in (False, True):
+        csv_metadata_to_mfc_file(
+            csv,
+            link,
+            "StatVar",
+            csv_options=csv_options,
+            override=override,
+            max_workers=max_workers,
+        )
+        assert link.is_symlink()
+
+    # The second (override) call replaced the appended content of the first
+    dcids = [l for l in target.read_text().splitlines() if l.startswith("Node")]
+    assert dcids == ["Node: dcid:n1", "Node: dcid:n2"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "out.mcf",
+        "real.mcf",
+        "sv.csv",
+    ]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+@pytest.mark.parametrize("override", [True, False])
+@pytest.mark.parametrize("csv_options, max_workers", _WRITE_PATHS)
+def test_csv_metadata_to_mfc_file_keeps_permissions(
+    tmp_path, csv_options, max_workers, override
+):
+    csv = tmp_path / "sv.csv"
+    csv.write_text("Node,name\ndcid:n1,Name1\n")
+    mcf = tmp_path / "out.mcf"
+    mcf.write_text("Node: dcid:existing\n\n")
+    mcf.chmod(0o640)
+
+    csv_metadata_to_mfc_file(
+        csv,
+        mcf,
+        "StatVar",
+        csv_options=csv_options,
+        override=override,
+        max_workers=max_workers,
+    )
+
+    assert mcf.stat().st_mode & 0o777 == 0o640
+    assert ("dcid:existing" in mcf.read_text()) is not override
+
+
+def test_csv_metadata_to_mfc_file_parallel_keeps_order(tmp_path):
+    rows = "".join(f"dcid:n{i},Name{i}\n" for i in range(20))
+    csv = tmp_path / "sv.csv"
+    csv.write_text("Node,name\n" + rows)
+    mcf = tmp_path / "out.mcf"
+
+    csv_metadata_to_mfc_file(
+        csv, mcf, "StatVar", csv_options={"chunksize": 3}, max_workers=2
+    )
+
+    dcids = [line for line in mcf.read_text().splitlines() if line.startswith("Node")]
+    assert dcids == [f"Node: dcid:n{i}" for i in range(20)]
+
+
 def test_single_level_group():
     sv = make_sv("Category")
     nodes = MCFNodes(nodes=[sv])
@@ -106,6 +235,19 @@ def test_duplicate_paths_do_not_create_duplicates():
     assert "dcid:ns2/g/Z" in slugs
 
 
+def test_shared_path_points_every_statvar_to_deepest_group():
+    nodes = MCFNodes(nodes=[make_sv("X/Y"), make_sv("X/Y"), make_sv("X")])
+
+    result = build_stat_var_groups_from_strings(nodes, groups_namespace="ns3")
+
+    assert [g.Node for g in get_group_nodes(result)] == ["dcid:ns3/g/X", "dcid:ns3/g/Y"]
+    assert [sv.memberOf for sv in get_statvar_nodes(result)] == [
+        "dcid:ns3/g/Y",
+        "dcid:ns3/g/Y",
+        "dcid:ns3/g/X",
+    ]
+
+
 def test_to_camelcase_multi_word():
     assert (
         to_camelCase("Official Development Assistance")
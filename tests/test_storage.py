@@ -10,6 +10,7 @@ from bblocks.datacommons_tools.gcp_utilities.storage import (
     get_missing_csv_files,
     delete_bucket_files,
     get_bucket_files,
+    upload_directory_to_gcs,
 )
 from bblocks.datacommons_tools.custom_data.models.config_file import Config
 from bblocks.datacommons_tools.custom_data.models.data_files import (
@@ -199,3 +200,28 @@ def test_get_bucket_files_multiple_types():
     pd.testing.assert_frame_equal(result["a.csv"], expected_df)
     assert result["b.json"] == {"x": 1}
     assert result["c.mcf"].nodes[0].Node == "dcid:n"
+
+
+def test_upload_directory_to_gcs(tmp_path):
+    (tmp_path / "config.json").write_text("{}")
+    (tmp_path / "a.csv").write_text("a\n1\n")
+    (tmp_path / "notes.txt").write_text("skip")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.mcf").write_text("")
+    (tmp_path / "sub" / "skip.json").write_text("{}")
+
+    bucket = Mock()
+    blobs: dict[str, Mock] = {}
+
+    def blob_side(name: str):
+        blobs[name] = Mock()
+        return blobs[name]
+
+    bucket.blob.side_effect = blob_side
+
+    upload_directory_to_gcs(bucket, tmp_path, "input", max_workers=2)
+
+    assert set(blobs) == {"input/config.json", "input/a.csv", "input/sub/b.mcf"}
+    blobs["input/a.csv"].upload_from_filename.assert_called_once_with(
+        str(tmp_path / "a.csv")
+    )